@@ -8,7 +8,12 @@ bl_info = {
     "category": "Animation",
 }
 
+import os
+import time
+import hashlib
+import itertools
 import bpy
+import numpy as np
 from bpy_extras import view3d_utils
 from mathutils import Vector, Quaternion, Matrix
 from bpy.props import FloatProperty, BoolProperty, EnumProperty, PointerProperty, IntProperty, StringProperty, CollectionProperty
@@ -74,6 +79,749 @@ class CollisionSettings(bpy.types.PropertyGroup):
         ],
         default='NEG_X'
     )
+    collision_backend: EnumProperty(
+        name="Collision Backend",
+        description="How environment distance queries are answered",
+        items=[
+            ('BVH', "BVH Tree", "Exact ray casts and nearest-point queries on the mesh"),
+            ('SDF', "Voxel SDF", "Proximity queries from a baked narrow-band distance field, sweeps still ray cast the BVH"),
+        ],
+        default='BVH'
+    )
+    sdf_resolution: IntProperty(
+        name="Voxels per Distance",
+        description="Voxels per Surface Distance (voxel size = Surface Distance / value)",
+        default=2,
+        min=1, max=8
+    )
+    sdf_merge: BoolProperty(
+        name="Merge Into One Grid",
+        description="Bake all environment objects into a single distance field",
+        default=False
+    )
+    sdf_cache_dir: StringProperty(
+        name="SDF Cache Folder",
+        description="Folder where baked grids are saved and memory-mapped from (empty = keep in RAM only)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+# --- SDF BACKEND ---
+SDF_BRICK = 8           # voxels per brick edge, bricks store one extra apron sample
+SDF_BAND_FACTOR = 3.0   # narrow band half-width in Surface Distances, proximity queries reach 2x
+SDF_MAX_CELLS = 64 ** 3 # coarse brick lattice budget, voxels grow past this
+SDF_BAKE_CHUNK = 1 << 18 # point/triangle pairs evaluated at once while baking
+SDF_EXACT_TRIS = 64      # bricks with more nearby triangles only search a thin shell exactly
+
+# Baked grids kept across operator runs, keyed by (grid key, input digest)
+_sdf_grid_cache = {}
+
+def evaluated_mesh_data(context, obj):
+    depsgraph = context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        verts = [v.co.copy() for v in mesh.vertices]
+        polys = [tuple(p.vertices) for p in mesh.polygons]
+    finally:
+        obj_eval.to_mesh_clear()
+    return verts, polys
+
+def evaluated_mesh_arrays(context, obj):
+    """World-space vertices (N, 3) and triangles (M, 3) of the evaluated mesh as NumPy arrays."""
+    depsgraph = context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+    finally:
+        obj_eval.to_mesh_clear()
+    mat = np.array(obj.matrix_world, dtype=np.float64)
+    verts = co.reshape(-1, 3).astype(np.float64) @ mat[:3, :3].T + mat[:3, 3]
+    tris = tris.reshape(-1, 3)
+    if np.linalg.det(mat[:3, :3]) < 0.0:
+        # Mirrored objects flip handedness, reverse the winding so face normals still point outward
+        tris = tris[:, ::-1]
+    return verts, tris
+
+def closed_mesh_volume(verts, tris):
+    """Signed volume of a closed triangle mesh (positive with outward normals), None if it has open edges."""
+    edges = np.sort(np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    if (counts != 2).any():
+        return None
+    a, b, c = (verts[tris[:, k]] for k in range(3))
+    return float((a * np.cross(b, c)).sum()) / 6.0
+
+def collect_collision_candidates(context, settings):
+    active_obj = context.active_object
+
+    if settings.collision_source == 'ALL':
+        return [o for o in context.scene.objects
+                if o.type == 'MESH' and o.visible_get() and o != active_obj]
+
+    if settings.collision_source == 'COLLECTION':
+        if settings.col_collection:
+            return [o for o in settings.col_collection.objects
+                    if o.type == 'MESH' and o.visible_get() and o != active_obj]
+
+    elif settings.collision_source == 'OBJECT':
+        if settings.col_object and settings.col_object.type == 'MESH':
+            return [settings.col_object]
+
+    return []
+
+class FlowSDFGrid:
+    """Sparse narrow-band signed distance field baked in world space.
+
+    brick_index is a dense int32 lattice of bricks (-1 = farther than band),
+    bricks holds (SDF_BRICK + 1)^3 float32 samples per allocated brick.
+    Only answers proximity queries, sweeps stay on the BVH.
+    """
+
+    def __init__(self, meta, brick_index, bricks):
+        self.meta = meta
+        self.voxel_size = float(meta[0])
+        self.band = float(meta[1])
+        self.origin = (float(meta[2]), float(meta[3]), float(meta[4]))
+        self.brick_index = brick_index
+        self.bricks = bricks
+        self.dims = brick_index.shape
+        # Samples are clamped to the band in float32, compare against that rather than the float64 band
+        self._cutoff = float(np.float32(self.band))
+        # Bricks copied to flat float32 memoryviews on first touch, indexing NumPy arrays per sample costs more than the lookup
+        self._brick_lists = {}
+
+    @property
+    def copy_nbytes(self):
+        """Bytes held by the flat brick copies sample() made so far."""
+        return sum(brick.nbytes for brick in self._brick_lists.values() if brick)
+
+    @property
+    def nbytes(self):
+        return self.brick_index.nbytes + self.bricks.nbytes + self.copy_nbytes
+
+    def _brick(self, bx, by, bz):
+        key = (bx * self.dims[1] + by) * self.dims[2] + bz
+        brick = self._brick_lists.get(key)
+        if brick is None:
+            idx = int(self.brick_index[bx, by, bz])
+            brick = memoryview(self.bricks[idx].tobytes()).cast('f') if idx >= 0 else ()
+            self._brick_lists[key] = brick
+        return brick
+
+    def sample(self, pt):
+        """Return (distance, (dx, dy, dz) gradient) at a world point, (None, None) outside the band."""
+        inv = 1.0 / self.voxel_size
+        gx = (pt[0] - self.origin[0]) * inv
+        gy = (pt[1] - self.origin[1]) * inv
+        gz = (pt[2] - self.origin[2]) * inv
+        if gx < 0.0 or gy < 0.0 or gz < 0.0:
+            return None, None
+        ix, iy, iz = int(gx), int(gy), int(gz)
+        bx, by, bz = ix // SDF_BRICK, iy // SDF_BRICK, iz // SDF_BRICK
+        if bx >= self.dims[0] or by >= self.dims[1] or bz >= self.dims[2]:
+            return None, None
+
+        brick = self._brick(bx, by, bz)
+        if not brick:
+            return None, None
+
+        # Samples are (SDF_BRICK + 1)^3 in C order, so +1 steps z, +n steps y, +n*n steps x
+        n = SDF_BRICK + 1
+        base = ((ix - bx * SDF_BRICK) * n + (iy - by * SDF_BRICK)) * n + (iz - bz * SDF_BRICK)
+        c000 = brick[base]
+        c001 = brick[base + 1]
+        c010 = brick[base + n]
+        c011 = brick[base + n + 1]
+        c100 = brick[base + n * n]
+        c101 = brick[base + n * n + 1]
+        c110 = brick[base + n * n + n]
+        c111 = brick[base + n * n + n + 1]
+        lo = min(c000, c001, c010, c011, c100, c101, c110, c111)
+        hi = max(c000, c001, c010, c011, c100, c101, c110, c111)
+        if lo < -self.voxel_size and hi > self.voxel_size:
+            # A surface can't flip the sign by more than a voxel per voxel. This cell straddles a
+            # seam instead (the face plane past an open border, unsigned samples beyond reach)
+            c000, c001, c010, c011 = abs(c000), abs(c001), abs(c010), abs(c011)
+            c100, c101, c110, c111 = abs(c100), abs(c101), abs(c110), abs(c111)
+            lo = min(c000, c001, c010, c011, c100, c101, c110, c111)
+        if lo >= self._cutoff or hi <= -self._cutoff:
+            # Cells wholly outside the band carry no surface, their signs are not baked
+            return None, None
+
+        # Trilinear blend and its analytic derivative
+        fx, fy, fz = gx - ix, gy - iy, gz - iz
+        c00 = c000 + (c001 - c000) * fz
+        c01 = c010 + (c011 - c010) * fz
+        c10 = c100 + (c101 - c100) * fz
+        c11 = c110 + (c111 - c110) * fz
+        c0 = c00 + (c01 - c00) * fy
+        c1 = c10 + (c11 - c10) * fy
+        dist = c0 + (c1 - c0) * fx
+
+        dz0 = (c001 - c000) + ((c011 - c010) - (c001 - c000)) * fy
+        dz1 = (c101 - c100) + ((c111 - c110) - (c101 - c100)) * fy
+        grad = (
+            (c1 - c0) * inv,
+            ((c01 - c00) + ((c11 - c10) - (c01 - c00)) * fx) * inv,
+            (dz0 + (dz1 - dz0) * fx) * inv,
+        )
+        return dist, grad
+
+    def find_nearest(self, pt, max_dist):
+        """Return (surface point, normal, distance) within max_dist or (None, None, None)."""
+        d, grad = self.sample(pt)
+        if d is None or abs(d) > max_dist:
+            return None, None, None
+        normal = Vector(grad)
+        if normal.length < 1e-8:
+            return None, None, None
+        normal.normalize()
+        return pt - normal * d, normal, abs(d)
+
+def _closest_on_triangles(ap, ab, ac, ab_ab, ab_ac, ac_ac):
+    """Closest points from points to triangles, one pair per column.
+
+    ap, ab, ac are (3, K) arrays of p - a, b - a and c - a, ab_ab, ab_ac and
+    ac_ac the matching (K,) edge dot products. Returns squared distances, the
+    closest point as a + u * ab + v * ac through u, v, and the feature hit:
+    0/1/3 = vertex a/b/c, 2/4/5 = edge ab/ca/bc, 6 = face.
+    """
+    d1 = ab[0] * ap[0] + ab[1] * ap[1] + ab[2] * ap[2]
+    d2 = ac[0] * ap[0] + ac[1] * ap[1] + ac[2] * ap[2]
+    # bp = ap - ab and cp = ap - ac, so the remaining dot products need no new vectors
+    d3 = d1 - ab_ab
+    d4 = d2 - ab_ac
+    d5 = d1 - ab_ac
+    d6 = d2 - ac_ac
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    # Voronoi regions in the order of Ericson's ClosestPtPointTriangle, first match wins
+    regions = [
+        (d1 <= 0.0) & (d2 <= 0.0),
+        (d3 >= 0.0) & (d4 <= d3),
+        (vc <= 0.0) & (d1 >= 0.0) & (d3 <= 0.0),
+        (d6 >= 0.0) & (d5 <= d6),
+        (vb <= 0.0) & (d2 >= 0.0) & (d6 <= 0.0),
+        (va <= 0.0) & (d4 - d3 >= 0.0) & (d5 - d6 >= 0.0),
+    ]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_ab = d1 / (d1 - d3)
+        t_ac = d2 / (d2 - d6)
+        t_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        denom = 1.0 / (va + vb + vc)
+    feature = np.full(d1.shape, 6)
+    u = vb * denom
+    v = vc * denom
+    # Applied last to first so earlier regions win
+    for region, code, ru, rv in reversed(list(zip(regions, range(6),
+                                                  [0.0, 1.0, t_ab, 0.0, 0.0, 1.0 - t_bc],
+                                                  [0.0, 0.0, 0.0, 1.0, t_ac, t_bc]))):
+        feature[region] = code
+        u = np.where(region, ru, u)
+        v = np.where(region, rv, v)
+
+    # |ap - u ab - v ac|^2 expanded, triangles are small next to float64 precision
+    sq = (ap[0] * ap[0] + ap[1] * ap[1] + ap[2] * ap[2]
+          - 2.0 * (u * d1 + v * d2) + u * u * ab_ab + 2.0 * u * v * ab_ac + v * v * ac_ac)
+    return np.maximum(sq, 0.0), u, v, feature
+
+def _triangle_pseudo_normals(verts, tris):
+    """Angle-weighted pseudo-normals per triangle feature (T, 7, 3), indexed like _closest_on_triangles.
+
+    Signs taken from these stay consistent across edges and vertex fans,
+    unlike the normal of whichever face happens to be nearest. Open borders
+    keep the normals of the faces they have, so the underside of a floor
+    stays negative right up to its edge.
+    """
+    corners = [verts[tris[:, k]] for k in range(3)]
+    face_n = np.cross(corners[1] - corners[0], corners[2] - corners[0])
+    face_n /= np.linalg.norm(face_n, axis=1)[:, None]
+
+    vert_n = np.zeros_like(verts)
+    for k in range(3):
+        e1 = corners[(k + 1) % 3] - corners[k]
+        e2 = corners[(k + 2) % 3] - corners[k]
+        cos = (e1 * e2).sum(1) / (np.linalg.norm(e1, axis=1) * np.linalg.norm(e2, axis=1))
+        np.add.at(vert_n, tris[:, k], face_n * np.arccos(np.clip(cos, -1.0, 1.0))[:, None])
+
+    # Edges ab, bc, ca of every triangle, shared edges sum both face normals
+    edges = np.sort(np.stack([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]], axis=1).reshape(-1, 2), axis=1)
+    unique_edges, inverse = np.unique(edges, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    edge_n = np.zeros((len(unique_edges), 3))
+    np.add.at(edge_n, inverse, np.repeat(face_n, 3, axis=0))
+    tri_edge_n = edge_n[inverse].reshape(-1, 3, 3)
+    tri_vert_n = vert_n[tris]
+
+    return np.stack([tri_vert_n[:, 0], tri_vert_n[:, 1], tri_edge_n[:, 0],
+                     tri_vert_n[:, 2], tri_edge_n[:, 2], tri_edge_n[:, 1], face_n], axis=1)
+
+def _vertex_rings(tris, vert_count):
+    """Triangles around every vertex, those of vertex v are ring[start[v]:start[v + 1]]."""
+    order = np.argsort(tris.reshape(-1), kind='stable')
+    start = np.searchsorted(tris.reshape(-1)[order], np.arange(vert_count + 1))
+    return order // 3, start
+
+def _neighbour_candidates(nearest, changed, neighbours, axis, step):
+    """Samples whose neighbour one step along axis changed to another triangle last pass.
+
+    nearest holds the nearest triangle per sample of each brick, neighbours the
+    brick slot on that side (-1 = none). Face samples are shared with the next
+    brick, so crossing a face lands on its second sample. Returns flat sample
+    indices and the neighbour's triangle.
+    """
+    n = nearest.shape[1]
+    ax = axis + 1
+
+    def part(arr, start, stop):
+        index = [slice(None)] * 4
+        index[ax] = slice(start, stop)
+        return arr[tuple(index)]
+
+    dst, src = ((0, n - 1), (1, n)) if step > 0 else ((1, n), (0, n - 1))
+    mask = part(changed, *src) & (part(nearest, *src) != part(nearest, *dst))
+    coords = list(np.nonzero(mask))
+    coords[ax] = coords[ax] + dst[0]
+    flat = [np.ravel_multi_index(coords, nearest.shape)]
+    cand = [part(nearest, *src)[mask]]
+
+    def plane(arr, bricks, i):
+        index = [bricks, slice(None), slice(None), slice(None)]
+        index[ax] = i
+        return arr[tuple(index)]
+
+    has = np.flatnonzero(neighbours >= 0)
+    face, inner = (n - 1, 1) if step > 0 else (0, n - 2)
+    other = neighbours[has]
+    mask = plane(changed, other, inner) & (plane(nearest, other, inner) != plane(nearest, has, face))
+    brick, i, j = np.nonzero(mask)
+    coords = [has[brick]] + [None] * 3
+    coords[ax] = np.full_like(i, face)
+    rest = [d for d in (1, 2, 3) if d != ax]
+    coords[rest[0]], coords[rest[1]] = i, j
+    flat.append(np.ravel_multi_index(coords, nearest.shape))
+    cand.append(plane(nearest, other, inner)[mask])
+    return np.concatenate(flat), np.concatenate(cand)
+
+def _direct_pairs(pts_t, candidates, centers, center_sq, radii, radius):
+    """Point/triangle pairs that can hold each point's nearest triangle within radius, grouped by point.
+
+    Pairs every point with every candidate, only used for the few candidates of sparse bricks.
+    """
+    pts_sq = (pts_t * pts_t).sum(0)
+    center_dist = np.sqrt(np.maximum(
+        pts_sq - 2.0 * (centers[candidates] @ pts_t) + center_sq[candidates][:, None], 0.0))
+    lower = center_dist - radii[candidates][:, None]
+    upper = (center_dist + radii[candidates][:, None]).min(axis=0)
+    pair_pt, pair_tri = np.nonzero((lower <= np.minimum(upper, radius)).T)
+    return pair_pt, candidates[pair_tri]
+
+def _sub_block_pairs(pts_t, sub_pts, candidates, centers, centers_t, center_sq, radii, radius, sub_reach, per_sub):
+    """Yield the same pairs as _direct_pairs in slices of about SDF_BAKE_CHUNK.
+
+    Points come in runs of per_sub around sub_pts. Candidates are culled per sub-block
+    first, both bounds loosened by sub_reach, then per point within the survivors.
+    """
+    step = max(1, SDF_BAKE_CHUNK // len(sub_pts))
+    chunks = [candidates[i:i + step] for i in range(0, len(candidates), step)]
+    sub_sq = (sub_pts * sub_pts).sum(1)
+
+    def sub_distances(chunk):
+        return np.sqrt(np.maximum(sub_sq - 2.0 * (centers[chunk] @ sub_pts.T) + center_sq[chunk][:, None], 0.0))
+
+    upper = np.full(len(sub_pts), np.inf)
+    for chunk in chunks:
+        upper = np.minimum(upper, (sub_distances(chunk) + radii[chunk][:, None]).min(axis=0))
+    limit = np.minimum(upper + sub_reach, radius) + sub_reach
+    sub_pair, sub_tri = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    for chunk in chunks:
+        s_idx, t_idx = np.nonzero((sub_distances(chunk) - radii[chunk][:, None] <= limit).T)
+        sub_pair.append(s_idx)
+        sub_tri.append(chunk[t_idx])
+    sub_pair = np.concatenate(sub_pair)
+    sub_tri = np.concatenate(sub_tri)
+    if len(chunks) > 1:
+        order = np.argsort(sub_pair, kind='stable')
+        sub_pair, sub_tri = sub_pair[order], sub_tri[order]
+
+    # Expanded to one pair per point, split so each slice stays near SDF_BAKE_CHUNK pairs
+    counts = np.bincount(sub_pair, minlength=len(sub_pts))
+    first = np.cumsum(counts) - counts
+    sizes = counts * per_sub
+    ends = np.cumsum(sizes)
+    cuts = np.searchsorted(ends, np.arange(SDF_BAKE_CHUNK, ends[-1], SDF_BAKE_CHUNK), side='right')
+    for s0, s1 in zip(np.r_[0, cuts], np.r_[cuts, len(sub_pts)]):
+        if s0 >= s1 or not sizes[s0:s1].any():
+            continue
+        blocks = np.repeat(np.arange(s0, s1), sizes[s0:s1])
+        j = np.arange(ends[s0] - sizes[s0], ends[s1 - 1]) - np.repeat(ends[s0:s1] - sizes[s0:s1], sizes[s0:s1])
+        k = counts[blocks]
+        pair_pt = blocks * per_sub + j // k
+        pair_tri = sub_tri[first[blocks] + j % k]
+
+        diff = pts_t[:, pair_pt] - centers_t[:, pair_tri]
+        center_dist = np.sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2])
+        starts = np.flatnonzero(np.r_[True, pair_pt[1:] != pair_pt[:-1]])
+        upper = np.minimum.reduceat(center_dist + radii[pair_tri], starts)
+        keep = center_dist - radii[pair_tri] <= np.repeat(np.minimum(upper, radius),
+                                                          np.diff(np.r_[starts, len(pair_pt)]))
+        yield pair_pt[keep], pair_tri[keep]
+
+def bake_sdf_grid(verts, tris, voxel_size, band):
+    """Bake world-space triangles (NumPy arrays) into a FlowSDFGrid."""
+    corners = [verts[tris[:, k]] for k in range(3)]
+    area = np.linalg.norm(np.cross(corners[1] - corners[0], corners[2] - corners[0]), axis=1)
+    tris = tris[area > 1e-12]
+    a, b, c = (verts[tris[:, k]] for k in range(3))
+    pseudo_n = _triangle_pseudo_normals(verts, tris)
+    # Bounding spheres, used to skip triangles that cannot be the nearest one
+    centers = (a + b + c) / 3.0
+    radii = np.sqrt(np.max([((corner - centers) ** 2).sum(1) for corner in (a, b, c)], axis=0))
+    center_sq = (centers * centers).sum(1)
+    ab = b - a
+    ac = c - a
+    a_t, ab_t, ac_t, centers_t = a.T.copy(), ab.T.copy(), ac.T.copy(), centers.T.copy()
+    ab_ab = (ab * ab).sum(1)
+    ab_ac = (ab * ac).sum(1)
+    ac_ac = (ac * ac).sum(1)
+    # Pseudo-normals per feature projected on the edges, for the sign test without closest points
+    n_ab = (pseudo_n * ab[:, None, :]).sum(2)
+    n_ac = (pseudo_n * ac[:, None, :]).sum(2)
+
+    pad = band + voxel_size
+    lo = verts.min(axis=0) - pad
+    hi = verts.max(axis=0) + pad
+    while True:
+        brick_size = voxel_size * SDF_BRICK
+        dims = tuple(int(n) for n in np.maximum(1, np.ceil((hi - lo) / brick_size)))
+        if dims[0] * dims[1] * dims[2] <= SDF_MAX_CELLS:
+            break
+        voxel_size *= 2.0
+
+    # Samples within reach get exact signed distances, so cells touching the band never mix
+    # in a guessed sign. Bin triangles into every brick their reach-padded bounds touch.
+    reach = band + 2.0 * voxel_size
+    tri_min = np.minimum(np.minimum(a, b), c)
+    tri_max = np.maximum(np.maximum(a, b), c)
+    tri_lo = np.clip(np.floor((tri_min - reach - lo) / brick_size).astype(int), 0, np.array(dims) - 1)
+    tri_hi = np.clip(np.floor((tri_max + reach - lo) / brick_size).astype(int), 0, np.array(dims) - 1)
+    bins = {}
+    for t in range(len(tris)):
+        for key in itertools.product(*(range(tri_lo[t, axis], tri_hi[t, axis] + 1) for axis in range(3))):
+            bins.setdefault(key, []).append(t)
+    keys = np.array(sorted(bins), dtype=int).reshape(-1, 3)
+    slot = np.full(dims, -1, dtype=np.int64)
+    slot[tuple(keys.T)] = np.arange(len(keys))
+    brick_corners = lo + keys * brick_size
+
+    # Near many small triangles every sample would pair with hundreds of candidates. Exact search
+    # only seeds a thin shell there, the rest of the band tries the nearest triangles of its
+    # neighbouring samples, growing one voxel per pass. Bricks next to those act as sources too.
+    shell = 2.0 * voxel_size
+    dense = np.array([len(bins[tuple(key)]) > SDF_EXACT_TRIS for key in keys], dtype=bool)
+    dense_grid = np.zeros(dims, dtype=bool)
+    dense_grid[tuple(keys[dense].T)] = True
+    padded = np.pad(dense_grid, 1)
+    near_dense = np.zeros(dims, dtype=bool)
+    for dx, dy, dz in itertools.product(range(3), repeat=3):
+        near_dense |= padded[dx:dx + dims[0], dy:dy + dims[1], dz:dz + dims[2]]
+    prop = np.flatnonzero(near_dense[tuple(keys.T)])
+    prop_of = np.full(len(keys), -1, dtype=np.int64)
+    prop_of[prop] = np.arange(len(prop))
+
+    samples = SDF_BRICK + 1
+    lattice = np.stack(np.meshgrid(*[np.arange(samples)] * 3, indexing='ij'), axis=-1).reshape(-1, 3)
+    local = lattice * voxel_size
+    dist = np.full((len(keys), samples ** 3), band, dtype=np.float32)
+    nearest = np.full((len(prop), samples ** 3), -1, dtype=np.int32)
+    nearest_sq = np.full((len(prop), samples ** 3), np.inf, dtype=np.float32)
+
+    def closest(pts_t, tri):
+        ap = pts_t - a_t[:, tri]
+        return ap, _closest_on_triangles(ap, ab_t[:, tri], ac_t[:, tri], ab_ab[tri], ab_ac[tri], ac_ac[tri])
+
+    def signed(ap, sq, u, v, feature, tri):
+        # (p - closest) . n = ap . n - u (ab . n) - v (ac . n)
+        side = ((ap.T * pseudo_n[tri, feature]).sum(1)
+                - u * n_ab[tri, feature] - v * n_ac[tri, feature])
+        near = np.minimum(np.sqrt(sq), band)
+        near[side < 0.0] *= -1.0
+        return near
+
+    # Samples are searched in 3^3 sub-blocks (SDF_BRICK + 1 = 9 per edge), triangles get culled
+    # per sub-block first so no batch ever pairs every sample with every candidate
+    sub = 3
+    per_sub = sub ** 3
+    sub_order = np.argsort(np.ravel_multi_index((lattice // sub).T, (samples // sub,) * 3), kind='stable')
+    offsets = local[sub_order]
+    sub_centers = offsets.reshape(-1, per_sub, 3).mean(axis=1)
+    sub_reach = np.sqrt(3.0) * (sub - 1) * 0.5 * voxel_size
+
+    # Bricks along a wall share the same few triangles, batching those amortises the NumPy call overhead
+    groups = {}
+    for key in sorted(bins):
+        groups.setdefault(tuple(bins[key]), []).append(key)
+    batches = [(keys_[i:i + 8], tri_ids) for tri_ids, keys_ in groups.items() for i in range(0, len(keys_), 8)]
+
+    for batch_keys, tri_ids in batches:
+        corner = lo + np.array(batch_keys) * brick_size
+        pts_t = (corner[:, None, :] + offsets).reshape(-1, 3).T.copy()
+        sub_pts = (corner[:, None, :] + sub_centers).reshape(-1, 3)
+        candidates = np.array(tri_ids)
+        exact = len(candidates) <= SDF_EXACT_TRIS
+        radius = reach if exact else shell
+        if not exact:
+            near_box = (tri_max[candidates] >= corner.min(axis=0) - shell) & \
+                       (tri_min[candidates] <= corner.max(axis=0) + brick_size + shell)
+            candidates = candidates[near_box.all(axis=1)]
+
+        seed_tri = np.full(pts_t.shape[1], -1, dtype=np.int32)
+        seed_sq = np.full(pts_t.shape[1], np.inf)
+        seed_dist = np.full(pts_t.shape[1], band)
+
+        # Triangle t can only be nearest to p if |p - center_t| - r_t <= min over t' of |p - center_t'| + r_t'
+        if exact:
+            slices = [_direct_pairs(pts_t, candidates, centers, center_sq, radii, radius)]
+        else:
+            slices = _sub_block_pairs(pts_t, sub_pts, candidates, centers, centers_t, center_sq, radii,
+                                      radius, sub_reach, per_sub)
+
+        for pair_pt, pair_tri in slices:
+            if not len(pair_pt):
+                continue
+            ap, (sq, u, v, feature) = closest(pts_t[:, pair_pt], pair_tri)
+            # Pairs come grouped by point, keep the first minimum of each group
+            starts = np.flatnonzero(np.r_[True, pair_pt[1:] != pair_pt[:-1]])
+            best = np.minimum.reduceat(sq, starts)
+            ties = np.flatnonzero(sq == np.repeat(best, np.diff(np.r_[starts, len(sq)])))
+            win = ties[np.r_[True, pair_pt[ties[1:]] != pair_pt[ties[:-1]]]]
+            if not exact:
+                # Beyond the shell the search was not exhaustive, propagation fills those in
+                win = win[sq[win] <= shell * shell]
+            seed_tri[pair_pt[win]] = pair_tri[win]
+            seed_sq[pair_pt[win]] = sq[win]
+            if exact:
+                seed_dist[pair_pt[win]] = signed(ap[:, win], sq[win], u[win], v[win], feature[win], pair_tri[win])
+
+        rows = slot[tuple(np.array(batch_keys).T)]
+        dist[rows[:, None], sub_order] = seed_dist.reshape(len(rows), -1)
+        in_prop = prop_of[rows] >= 0
+        if in_prop.any():
+            nearest[prop_of[rows[in_prop]][:, None], sub_order] = seed_tri.reshape(len(rows), -1)[in_prop]
+            nearest_sq[prop_of[rows[in_prop]][:, None], sub_order] = seed_sq.reshape(len(rows), -1)[in_prop]
+
+    if len(prop):
+        # Propagate outward, a sample takes a neighbour's nearest triangle when it is closer. Six-way
+        # steps walk Manhattan paths, so reaching a voxel takes up to sqrt(3) times its distance in passes.
+        near_limit = reach + voxel_size
+        neighbours = np.full((len(prop), 3, 2), -1, dtype=np.int64)
+        for axis in range(3):
+            for side, step in enumerate((1, -1)):
+                other = keys[prop].copy()
+                other[:, axis] += step
+                inside = (other[:, axis] >= 0) & (other[:, axis] < dims[axis])
+                linked = slot[tuple(other[inside].T)]
+                neighbours[inside, axis, side] = np.where(linked >= 0, prop_of[linked], -1)
+
+        shape = (len(prop), samples, samples, samples)
+        nearest_flat = nearest.reshape(-1)
+        nearest_sq_flat = nearest_sq.reshape(-1)
+        changed = (nearest >= 0).reshape(shape)
+        for _ in range(int(np.ceil(np.sqrt(3.0) * near_limit / voxel_size)) + 1):
+            if not changed.any():
+                break
+            moved = np.zeros(len(nearest_flat), dtype=bool)
+            for axis in range(3):
+                for side, step in enumerate((1, -1)):
+                    flat, cand = _neighbour_candidates(nearest.reshape(shape), changed,
+                                                       neighbours[:, axis, side], axis, step)
+                    for i in range(0, len(flat), SDF_BAKE_CHUNK):
+                        f = flat[i:i + SDF_BAKE_CHUNK]
+                        tri = cand[i:i + SDF_BAKE_CHUNK]
+                        brick, cell = np.divmod(f, samples ** 3)
+                        sq = closest((brick_corners[prop[brick]] + local[cell]).T, tri)[1][0]
+                        better = (sq < nearest_sq_flat[f]) & (sq <= near_limit * near_limit)
+                        f = f[better]
+                        nearest_flat[f] = tri[better]
+                        nearest_sq_flat[f] = sq[better]
+                        moved[f] = True
+            changed = moved.reshape(shape)
+
+        # Triangles smaller than a voxel can hand a sample past its nearest one, so walk from each
+        # propagated triangle to those sharing a vertex with it for as long as that gets closer
+        ring, ring_start = _vertex_rings(tris, len(verts))
+        todo = np.flatnonzero((nearest_flat >= 0) & (nearest_sq_flat > shell * shell)
+                              & np.repeat(dense[prop], samples ** 3))
+        step = max(1, SDF_BAKE_CHUNK // 32)
+        while len(todo):
+            moved = []
+            for i in range(0, len(todo), step):
+                f = todo[i:i + step]
+                around = tris[nearest_flat[f]].reshape(-1)
+                counts = ring_start[around + 1] - ring_start[around]
+                per = counts.reshape(-1, 3).sum(1)
+                tri = ring[np.repeat(ring_start[around] - (np.cumsum(counts) - counts), counts)
+                           + np.arange(counts.sum())]
+                pair_pt = np.repeat(np.arange(len(f)), per)
+                brick, cell = np.divmod(f[pair_pt], samples ** 3)
+                sq = closest((brick_corners[prop[brick]] + local[cell]).T, tri)[1][0]
+                starts = np.cumsum(per) - per
+                best = np.minimum.reduceat(sq, starts)
+                ties = np.flatnonzero(sq == np.repeat(best, per))
+                win = ties[np.r_[True, pair_pt[ties[1:]] != pair_pt[ties[:-1]]]]
+                # Compared as stored, a float64 gain lost to float32 rounding would never settle
+                best = best.astype(np.float32)
+                better = best < nearest_sq_flat[f]
+                nearest_flat[f[better]] = tri[win[better]]
+                nearest_sq_flat[f[better]] = best[better]
+                moved.append(f[better])
+            todo = np.concatenate(moved)
+
+        # Signs and distances for the propagated bricks, the exact ones were finished while seeding
+        rows = np.flatnonzero(dense[prop])
+        for r0 in range(0, len(rows), max(1, SDF_BAKE_CHUNK // samples ** 3)):
+            chunk = rows[r0:r0 + max(1, SDF_BAKE_CHUNK // samples ** 3)]
+            brick, cell = np.nonzero(nearest[chunk] >= 0)
+            tri = nearest[chunk[brick], cell]
+            ap, (sq, u, v, feature) = closest((brick_corners[prop[chunk[brick]]] + local[cell]).T, tri)
+            dist[prop[chunk[brick]], cell] = signed(ap, sq, u, v, feature, tri)
+
+    # Bricks the band never reaches at sample resolution stay unallocated
+    used = np.abs(dist).min(axis=1) < np.float32(band)
+    brick_index = np.full(dims, -1, dtype=np.int32)
+    brick_index[tuple(keys[used].T)] = np.arange(used.sum(), dtype=np.int32)
+    bricks = dist[used].reshape(-1, samples, samples, samples)
+
+    meta = np.array([voxel_size, band, lo[0], lo[1], lo[2]], dtype=np.float64)
+    return FlowSDFGrid(meta, brick_index, bricks)
+
+def sdf_digest(verts, tris, voxel_size, band):
+    """Exact hash of everything a bake depends on, used to validate cached grids."""
+    h = hashlib.sha1()
+    h.update(verts.astype(np.float32).tobytes())
+    h.update(tris.astype(np.int32).tobytes())
+    h.update(np.array([voxel_size, band], dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+def _sdf_cache_paths(cache_dir, key):
+    # clean_name folds e.g. "Wall.001" and "Wall_001" together, the hash keeps them apart
+    name = bpy.path.clean_name(key) + "_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+    base = os.path.join(bpy.path.abspath(cache_dir), name)
+    return base + "_meta.npy", base + "_index.npy", base + "_bricks.npy", base + "_digest.npy"
+
+def save_sdf_grid(grid, cache_dir, key, digest):
+    meta_path, index_path, bricks_path, digest_path = _sdf_cache_paths(cache_dir, key)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    np.save(meta_path, grid.meta)
+    np.save(index_path, grid.brick_index)
+    np.save(bricks_path, grid.bricks)
+    # Written last, so an interrupted save never validates
+    np.save(digest_path, np.array(digest))
+
+def load_sdf_grid(cache_dir, key, digest):
+    """Memory-map a saved grid, None if missing, unreadable or baked from different inputs."""
+    paths = _sdf_cache_paths(cache_dir, key)
+    if not all(os.path.exists(p) for p in paths):
+        return None
+    meta_path, index_path, bricks_path, digest_path = paths
+    samples = SDF_BRICK + 1
+    try:
+        if str(np.load(digest_path)) != digest:
+            return None
+        meta = np.load(meta_path)
+        brick_index = np.load(index_path, mmap_mode='r')
+        bricks = np.load(bricks_path, mmap_mode='r')
+    except (OSError, ValueError, EOFError) as e:
+        print(f"FlowPose SDF Load Error {key}: {e}")
+        return None
+    if meta.shape != (5,) or brick_index.ndim != 3 or bricks.shape[1:] != (samples, samples, samples):
+        return None
+    return FlowSDFGrid(meta, brick_index, bricks)
+
+def sdf_bake_inputs(context, candidates, settings):
+    """Return [(cache key, world verts, triangles)] for each grid the settings ask for."""
+    if settings.sdf_merge and len(candidates) > 1:
+        groups = [("FlowPose_merged", candidates)]
+    else:
+        groups = [(obj.name, [obj]) for obj in candidates]
+
+    inputs = []
+    for key, objs in groups:
+        vert_arrays, tri_arrays = [], []
+        base = 0
+        for obj in objs:
+            try:
+                verts, tris = evaluated_mesh_arrays(context, obj)
+            except Exception as e:
+                print(f"FlowPose Cache Error {obj.name}: {e}")
+                continue
+            vert_arrays.append(verts)
+            tri_arrays.append(tris + base)
+            base += len(verts)
+        if not tri_arrays or not sum(len(t) for t in tri_arrays):
+            continue
+        inputs.append((key, np.concatenate(vert_arrays), np.concatenate(tri_arrays)))
+    return inputs
+
+def build_sdf_grids(context, candidates, settings, force=False, report=None, bake=True):
+    """SDF grids per environment group, from memory, the cache folder or a fresh bake.
+
+    With bake=False nothing gets baked, a missing or outdated grid returns an
+    empty dict so proximity stays on the BVH until Update Cache is pressed.
+    """
+    voxel_size = settings.offset_distance / settings.sdf_resolution
+    band = settings.offset_distance * SDF_BAND_FACTOR
+
+    def warn(msg):
+        if report:
+            report({'WARNING'}, msg)
+        else:
+            print(f"FlowPose {msg}")
+
+    grids = {}
+    built = set()
+    for key, verts, tris in sdf_bake_inputs(context, candidates, settings):
+        digest = sdf_digest(verts, tris, voxel_size, band)
+
+        grid = None if force else _sdf_grid_cache.get((key, digest))
+        if grid is None and settings.sdf_cache_dir and not force:
+            grid = load_sdf_grid(settings.sdf_cache_dir, key, digest)
+        if grid is None and not bake:
+            warn(f"SDF '{key}' is not baked for the current mesh and settings, proximity uses the BVH "
+                 f"(press Update Cache to bake it)")
+            return {}
+        if grid is None:
+            grid = bake_sdf_grid(verts, tris, voxel_size, band)
+            if grid.voxel_size > voxel_size:
+                warn(f"SDF '{key}' too large, voxels coarsened to {grid.voxel_size:.4f} "
+                     f"(thin walls may be missed, lower Voxels per Distance or split the environment)")
+            volume = closed_mesh_volume(verts, tris)
+            if volume is not None and volume < 0.0:
+                warn(f"SDF '{key}' is closed but its normals point inward, the enclosed space counts as free "
+                     f"(fine for rooms, otherwise recalculate normals)")
+            if settings.sdf_cache_dir:
+                try:
+                    save_sdf_grid(grid, settings.sdf_cache_dir, key, digest)
+                except OSError as e:
+                    print(f"FlowPose SDF Save Error {key}: {e}")
+
+        _sdf_grid_cache[(key, digest)] = grid
+        grids[key] = grid
+        built.add((key, digest))
+
+    # Only this build's grids stay alive, older bakes and groups no longer collected (renamed,
+    # removed, merge toggled) are dropped
+    for stale in [k for k in _sdf_grid_cache if k not in built]:
+        del _sdf_grid_cache[stale]
+    return grids
 
 # --- OPERATORS ---
 class OT_FlowPose(bpy.types.Operator):
@@ -87,6 +835,7 @@ class OT_FlowPose(bpy.types.Operator):
     ik_constraint = None
     ik_target_bone = None
     bvh_trees = {}
+    sdf_grids = {}
     
     # Cache stop bones names for performance
     stop_bone_names = []
@@ -113,40 +862,57 @@ class OT_FlowPose(bpy.types.Operator):
 
     def build_collision_cache(self, context):
         self.bvh_trees = {}
+        self.sdf_grids = {}
         settings = context.scene.collision_settings
         if not settings.enabled:
             return
 
-        candidates = []
-        active_obj = context.active_object
-
-        if settings.collision_source == 'ALL':
-            candidates = [o for o in context.scene.objects
-                          if o.type == 'MESH' and o.visible_get() and o != active_obj]
+        candidates = collect_collision_candidates(context, settings)
 
-        elif settings.collision_source == 'COLLECTION':
-            if settings.col_collection:
-                candidates = [o for o in settings.col_collection.objects
-                              if o.type == 'MESH' and o.visible_get() and o != active_obj]
-
-        elif settings.collision_source == 'OBJECT':
-            if settings.col_object and settings.col_object.type == 'MESH':
-                candidates = [settings.col_object]
+        if settings.collision_backend == 'SDF':
+            # Baking dense meshes takes seconds, that belongs to Update Cache rather than the drag start
+            self.sdf_grids = build_sdf_grids(context, candidates, settings, report=self.report, bake=False)
 
+        # Sweeps always ray cast the BVH, the SDF backend only takes over proximity queries
         for obj in candidates:
             try:
-                depsgraph = context.evaluated_depsgraph_get()
-                obj_eval = obj.evaluated_get(depsgraph)
-                mesh = obj_eval.to_mesh()
-                bvh = BVHTree.FromPolygons(
-                    [v.co for v in mesh.vertices],
-                    [p.vertices for p in mesh.polygons]
-                )
+                verts, polys = evaluated_mesh_data(context, obj)
+                bvh = BVHTree.FromPolygons(verts, polys)
                 self.bvh_trees[obj.name] = (bvh, obj.matrix_world.copy())
-                obj_eval.to_mesh_clear()
             except Exception as e:
                 print(f"FlowPose Cache Error {obj.name}: {e}")
 
+    def cast_environment(self, start_pos, move_vec):
+        """Yield (world location, world normal) for every object hit along move_vec."""
+        move_len = move_vec.length
+        move_dir = move_vec.normalized() if move_len > 0.00001 else Vector((0,0,1))
+
+        for name, (bvh, mat) in self.bvh_trees.items():
+            mat_inv = mat.inverted()
+            local_start = mat_inv @ start_pos
+            local_dir = (mat_inv.to_3x3() @ move_dir).normalized()
+            scale_fac = (mat_inv.to_3x3() @ move_vec).length / (move_len if move_len > 0 else 1)
+            local_dist = move_len * scale_fac
+
+            loc, normal, idx, dist = bvh.ray_cast(local_start, local_dir, local_dist)
+            if loc:
+                yield mat @ loc, (mat.to_3x3() @ normal).normalized()
+
+    def nearest_environment(self, pos, max_dist):
+        """Yield (world surface point, world normal) for every object within max_dist."""
+        if self.sdf_grids:
+            for grid in self.sdf_grids.values():
+                loc, normal, dist = grid.find_nearest(pos, max_dist)
+                if loc:
+                    yield loc, normal
+            return
+
+        for name, (bvh, mat) in self.bvh_trees.items():
+            local_pt = mat.inverted() @ pos
+            loc, normal, idx, dist = bvh.find_nearest(local_pt, max_dist)
+            if loc:
+                yield mat @ loc, (mat.to_3x3() @ normal).normalized()
+
     def solve_collision(self, start_pos, end_pos, context):
         if not self.bvh_trees or not context.scene.collision_settings.enabled:
             return end_pos, Vector((0,0,1)), False
@@ -163,23 +929,13 @@ class OT_FlowPose(bpy.types.Operator):
         best_hit_info = None
         last_normal = Vector((0,0,1))
 
-        for name, (bvh, mat) in self.bvh_trees.items():
-            mat_inv = mat.inverted()
-            local_start = mat_inv @ start_pos
-            local_dir = (mat_inv.to_3x3() @ move_dir).normalized()
-            scale_fac = (mat_inv.to_3x3() @ move_vec).length / (move_len if move_len > 0 else 1)
-            local_dist = move_len * scale_fac
-
-            loc, normal, idx, dist = bvh.ray_cast(local_start, local_dir, local_dist)
-            if loc:
-                world_loc = mat @ loc
-                world_normal = (mat.to_3x3() @ normal).normalized()
-                world_dist = (world_loc - start_pos).length
-                if world_dist < closest_dist:
-                    closest_dist = world_dist
-                    best_hit_info = (world_loc, world_normal)
-                    hit_occured = True
-                    last_normal = world_normal
+        for world_loc, world_normal in self.cast_environment(start_pos, move_vec):
+            world_dist = (world_loc - start_pos).length
+            if world_dist < closest_dist:
+                closest_dist = world_dist
+                best_hit_info = (world_loc, world_normal)
+                hit_occured = True
+                last_normal = world_normal
 
         if hit_occured:
             hit_pos, hit_norm = best_hit_info
@@ -197,20 +953,14 @@ class OT_FlowPose(bpy.types.Operator):
         corrected_prox = pos_to_check
         hit_proximity = False
 
-        for name, (bvh, mat) in self.bvh_trees.items():
-            mat_inv = mat.inverted()
-            local_pt = mat_inv @ pos_to_check
-            loc, normal, idx, dist = bvh.find_nearest(local_pt, offset * 2.0)
-            if loc:
-                world_surf = mat @ loc
-                world_norm = (mat.to_3x3() @ normal).normalized()
-                real_dist = (world_surf - pos_to_check).length
-                if real_dist < offset:
-                    vec_to = (pos_to_check - world_surf).normalized()
-                    if vec_to.dot(world_norm) < 0.1:
-                        corrected_prox = world_surf + (world_norm * offset)
-                        last_normal = world_norm
-                        hit_proximity = True
+        for world_surf, world_norm in self.nearest_environment(pos_to_check, offset * 2.0):
+            real_dist = (world_surf - pos_to_check).length
+            if real_dist < offset:
+                vec_to = (pos_to_check - world_surf).normalized()
+                if vec_to.dot(world_norm) < 0.1:
+                    corrected_prox = world_surf + (world_norm * offset)
+                    last_normal = world_norm
+                    hit_proximity = True
 
         return corrected_prox, last_normal, (hit_occured or hit_proximity)
 
@@ -279,6 +1029,7 @@ class OT_FlowPose(bpy.types.Operator):
 
     def finish(self, context):
         self.bvh_trees.clear()
+        self.sdf_grids.clear()
 
     def process_smart_pull(self, context, active_bone, mouse_vector, distance_gap):
         obj = context.active_object
@@ -581,8 +1332,17 @@ class PT_FlowPosePanel(bpy.types.Panel):
             col.prop(col_settings, "slide_friction")
             col.prop(col_settings, "align_axis", text="Magnet Axis")
 
+            col.separator()
+            col.prop(col_settings, "collision_backend", text="Backend")
+            if col_settings.collision_backend == 'SDF':
+                col.prop(col_settings, "sdf_resolution")
+                if col_settings.collision_source != 'OBJECT':
+                    col.prop(col_settings, "sdf_merge")
+                col.prop(col_settings, "sdf_cache_dir", text="")
+
             col.separator()
             col.operator("pose.rebuild_collision_cache", icon='FILE_REFRESH', text="Update Cache")
+            col.operator("pose.flow_benchmark_collision", icon='TIME', text="Benchmark Backends")
 
         box = layout.box()
         col = box.column(align=True)
@@ -594,6 +1354,99 @@ class OT_RebuildCollisionCache(bpy.types.Operator):
     bl_label = "Rebuild Collision Cache"
 
     def execute(self, context):
+        settings = context.scene.collision_settings
+        if settings.enabled and settings.collision_backend == 'SDF':
+            # Rebake into the shared cache (and folder), the next [D] press reuses it
+            candidates = collect_collision_candidates(context, settings)
+            grids = build_sdf_grids(context, candidates, settings, force=True, report=self.report)
+            self.report({'INFO'}, f"Baked {len(grids)} SDF grid(s)")
+        return {'FINISHED'}
+
+class OT_FlowBenchmarkCollision(bpy.types.Operator):
+    bl_idname = "pose.flow_benchmark_collision"
+    bl_label = "Benchmark Collision Backends"
+    bl_description = "Compare sweep and proximity query throughput and memory of the BVH and SDF backends"
+
+    query_count: IntProperty(name="Queries", description="Query points per backend", default=20000, min=100)
+
+    def invoke(self, context, event):
+        # Ask for the query count first, the run bakes temporary grids and can take a while
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        settings = context.scene.collision_settings
+        candidates = collect_collision_candidates(context, settings)
+        if not candidates:
+            self.report({'WARNING'}, "No collision objects to benchmark")
+            return {'CANCELLED'}
+
+        offset = settings.offset_distance
+        t0 = time.perf_counter()
+        bvh_trees = []
+        mesh_bytes = 0
+        for obj in candidates:
+            verts, polys = evaluated_mesh_data(context, obj)
+            if not polys:
+                continue
+            bvh_trees.append((BVHTree.FromPolygons(verts, polys), obj.matrix_world.copy()))
+            mesh_bytes += len(verts) * 12 + sum(len(p) for p in polys) * 4
+        bvh_build = time.perf_counter() - t0
+
+        inputs = sdf_bake_inputs(context, candidates, settings)
+        if not bvh_trees or not inputs:
+            self.report({'WARNING'}, "Collision objects have no faces")
+            return {'CANCELLED'}
+
+        # Temporary grids, the cache and the SDF Cache Folder are left untouched
+        voxel_size = offset / settings.sdf_resolution
+        t0 = time.perf_counter()
+        sdf_grids = [bake_sdf_grid(verts, tris, voxel_size, offset * SDF_BAND_FACTOR)
+                     for key, verts, tris in inputs]
+        sdf_build = time.perf_counter() - t0
+
+        # Query points scattered within 2x Surface Distance of face centers, where contact happens
+        rng = np.random.default_rng(0)
+        centers = np.concatenate([verts[tris].mean(axis=1) for key, verts, tris in inputs])
+        picked = centers[rng.integers(len(centers), size=self.query_count)]
+        jitter = rng.uniform(-2.0 * offset, 2.0 * offset, size=picked.shape)
+        points = [Vector(p) for p in (picked + jitter).tolist()]
+        directions = [Vector(d).normalized() for d in rng.normal(size=picked.shape).tolist()]
+
+        # Both backends sweep with BVH ray casts, as in cast_environment
+        t0 = time.perf_counter()
+        for pt, direction in zip(points, directions):
+            for bvh, mat in bvh_trees:
+                mat_inv = mat.inverted()
+                bvh.ray_cast(mat_inv @ pt, (mat_inv.to_3x3() @ direction).normalized(), offset * 2.0)
+        cast_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for pt in points:
+            for bvh, mat in bvh_trees:
+                bvh.find_nearest(mat.inverted() @ pt, offset * 2.0)
+        bvh_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for pt in points:
+            for grid in sdf_grids:
+                grid.find_nearest(pt, offset * 2.0)
+        sdf_time = time.perf_counter() - t0
+
+        # Measured after the queries so the brick copies they made are included
+        sdf_bytes = sum(grid.nbytes for grid in sdf_grids)
+        copy_bytes = sum(grid.copy_nbytes for grid in sdf_grids)
+        voxel_used = max(grid.voxel_size for grid in sdf_grids)
+        lines = [
+            f"Sweep (BVH ray cast, both backends): {self.query_count / max(cast_time, 1e-9):.0f} casts/s",
+            f"BVH: build {bvh_build:.3f}s, {self.query_count / max(bvh_time, 1e-9):.0f} nearest/s, "
+            f"mesh input {mesh_bytes / 1048576:.2f} MB (tree overhead not exposed)",
+            f"SDF: bake {sdf_build:.3f}s, {self.query_count / max(sdf_time, 1e-9):.0f} nearest/s, "
+            f"grids {sdf_bytes / 1048576:.2f} MB (of which {copy_bytes / 1048576:.2f} MB lookup copies), "
+            f"voxel {voxel_used:.4f}",
+        ]
+        for line in lines:
+            print(f"FlowPose Benchmark {line}")
+            self.report({'INFO'}, line)
         return {'FINISHED'}
 
 def register():
@@ -621,6 +1474,7 @@ def register():
     bpy.utils.register_class(OT_FlowRemoveStopBone)
     bpy.utils.register_class(OT_FlowClearAllStopBones)
     bpy.utils.register_class(OT_RebuildCollisionCache)
+    bpy.utils.register_class(OT_FlowBenchmarkCollision)
     bpy.utils.register_class(PT_FlowPosePanel)
 
     wm = bpy.context.window_manager
@@ -640,8 +1494,10 @@ def unregister():
     del bpy.types.Scene.flow_enable_pull
     del bpy.types.Scene.flow_lock_selection
     del bpy.types.Scene.flow_stop_bones
+    _sdf_grid_cache.clear()
 
     bpy.utils.unregister_class(PT_FlowPosePanel)
+    bpy.utils.unregister_class(OT_FlowBenchmarkCollision)
     bpy.utils.unregister_class(OT_RebuildCollisionCache)
     bpy.utils.unregister_class(OT_FlowPickStopBone)
     bpy.utils.unregister_class(OT_FlowRemoveStopBone)